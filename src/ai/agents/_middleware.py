@@ -48,7 +48,7 @@ if TYPE_CHECKING:
     from .agent import Context
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ModelContext:
     """Context for a model streaming call."""
 
@@ -65,7 +65,7 @@ class ModelContext:
         object.__setattr__(self, "kwargs", dict(self.kwargs))
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class GenerateContext:
     """Context for a model generate call (images, video, etc.)."""
 
@@ -77,7 +77,7 @@ class GenerateContext:
         object.__setattr__(self, "messages", list(self.messages))
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ToolContext:
     """Context for a tool execution."""
 
@@ -89,7 +89,7 @@ class ToolContext:
         object.__setattr__(self, "kwargs", dict(self.kwargs))
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class HookContext:
     """Context for a hook suspension point."""
 
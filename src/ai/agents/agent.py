@@ -6,7 +6,6 @@ import asyncio
 import contextlib
 import dataclasses
 import inspect
-import json
 import typing
 from collections.abc import (
     AsyncGenerator,
@@ -542,7 +541,9 @@ class BoundToolCall:
     def kwargs(self) -> dict[str, Any]:
         if self._kwargs is None:
             kwargs = (
-                json.loads(self._part.tool_args) if self._part.tool_args else {}
+                util.parse_json(self._part.tool_args)
+                if self._part.tool_args
+                else {}
             )
             self._kwargs = _validate_kwargs(self._tool, kwargs)
         return dict(self._kwargs)
@@ -804,6 +805,21 @@ class ToolRunner:
                     yield res
 
 
+def _resolve_tool_call(
+    tools_by_name: dict[str, AgentTool],
+    tool_part: types.messages.ToolCallPart,
+) -> ToolCall:
+    tool = tools_by_name.get(tool_part.tool_name)
+    if tool is None:
+        raise KeyError(
+            f"No agent executor registered for tool {tool_part.tool_name!r}"
+        )
+    tc = BoundToolCall(part=tool_part, tool=tool)
+    if tool.require_approval:
+        return GatedToolCall(tc)
+    return tc
+
+
 class Context(pydantic.BaseModel):
     """Everything that goes into the LLM."""
 
@@ -853,18 +869,13 @@ class Context(pydantic.BaseModel):
         | Sequence[types.messages.ToolCallPart],
     ) -> ToolCall | list[ToolCall]:
         """Resolve ToolCallPart(s) into callable ToolCall object(s)."""
+        # ``_agent_tools_by_name`` is a pydantic private attribute, which
+        # is read through ``BaseModel.__getattr__``; fetch it once for
+        # the whole batch.
+        tools_by_name = self._agent_tools_by_name
         if isinstance(tool_part, types.messages.ToolCallPart):
-            tool = self._agent_tools_by_name.get(tool_part.tool_name)
-            if tool is None:
-                raise KeyError(
-                    "No agent executor registered for tool "
-                    f"{tool_part.tool_name!r}"
-                )
-            tc = BoundToolCall(part=tool_part, tool=tool)
-            if tool.require_approval:
-                return GatedToolCall(tc)
-            return tc
-        return [self.resolve(tp) for tp in tool_part]
+            return _resolve_tool_call(tools_by_name, tool_part)
+        return [_resolve_tool_call(tools_by_name, tp) for tp in tool_part]
 
     def add(
         self,
@@ -21,7 +21,7 @@ Cancellation::
 from __future__ import annotations
 
 import asyncio
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import pydantic
 
@@ -35,7 +35,8 @@ from . import runtime as runtime_
 #
 # _live_hooks:
 #   Populated by hook() when it suspends inside a running agent.
-#   Maps hook label -> (future, metadata dict, Runtime).
+#   Maps hook label -> (future, metadata dict, Runtime).  The future
+#   receives either a raw dict or a payload model instance.
 #   Consumed by resolve_hook() / cancel_hook() to unblock the awaiting
 #   coroutine.  Entries are removed when the hook resolves, cancels, or
 #   the run completes.
@@ -43,17 +44,26 @@ from . import runtime as runtime_
 # _pending_resolutions:
 #   Populated by resolve_hook() when no live hook exists yet (serverless
 #   re-entry: the user calls resolve_hook() *before* agent.run() replays).
-#   Maps hook label -> (payload type, validated resolution dict).
+#   Maps hook label -> resolution: a raw dict, an already-validated
+#   payload model (returned as-is by hook() without re-validating), or
+#   an exception to raise.
 #   Consumed by hook() at the start of execution — if a pre-registered
 #   resolution exists for the label, the hook returns immediately without
 #   suspending.  Entries are removed on consumption.
 # ---------------------------------------------------------------------------
 
 _live_hooks: dict[
-    str, tuple[asyncio.Future[dict[str, Any]], dict[str, Any], runtime_.Runtime]
+    str,
+    tuple[
+        asyncio.Future[dict[str, Any] | pydantic.BaseModel],
+        dict[str, Any],
+        runtime_.Runtime,
+    ],
 ] = {}
 
-_pending_resolutions: dict[str, dict[str, Any] | BaseException] = {}
+_pending_resolutions: dict[
+    str, dict[str, Any] | pydantic.BaseModel | BaseException
+] = {}
 
 
 class HookPendingError(Exception):
@@ -69,6 +79,30 @@ class HookPendingError(Exception):
         self.hook = hook
 
 
+def _hook_part(
+    label: str,
+    hook_type: str,
+    status: Literal["pending", "resolved", "cancelled"],
+    metadata: dict[str, Any],
+    *,
+    resolution: Any = None,
+) -> messages_.HookPart[Any]:
+    """Build a hook signal part without re-running pydantic validation.
+
+    Every field is produced locally with the right type, so
+    ``model_construct`` is safe and skips the validator pass.  Validation
+    would have copied ``metadata``; each part gets its own shallow copy
+    here instead, so parts and the live-hook registry never share a dict.
+    """
+    return messages_.HookPart.model_construct(
+        hook_id=label,
+        hook_type=hook_type,
+        status=status,
+        metadata=dict(metadata),
+        resolution=resolution,
+    )
+
+
 def cleanup_run(labels: set[str]) -> None:
     """Remove all registry entries associated with a finished run."""
     for label in labels:
@@ -106,7 +140,6 @@ async def hook[T: pydantic.BaseModel](
 
 async def _hook_impl(call: middleware_.HookContext) -> pydantic.BaseModel:
     """Core hook logic — the innermost ``next`` in the middleware chain."""
-    rt = runtime_.get_runtime()
     label = call.label
     payload = call.payload
     hook_metadata = call.metadata
@@ -116,21 +149,23 @@ async def _hook_impl(call: middleware_.HookContext) -> pydantic.BaseModel:
     if pre_registered is not None:
         if isinstance(pre_registered, BaseException):
             raise pre_registered
-        return payload(**pre_registered)
+        if isinstance(pre_registered, payload):
+            return pre_registered
+        if isinstance(pre_registered, pydantic.BaseModel):
+            pre_registered = pre_registered.model_dump()
+        return payload.model_validate(pre_registered)
 
     # No resolution available — suspend.
-    future: asyncio.Future[dict[str, Any]] = asyncio.Future()
+    rt = runtime_.get_runtime()
+    future: asyncio.Future[dict[str, Any] | pydantic.BaseModel] = (
+        asyncio.get_running_loop().create_future()
+    )
 
     _live_hooks[label] = (future, hook_metadata, rt)
     rt.track_hook_label(label)
 
     # Emit pending signal.
-    hook_part: messages_.HookPart[Any] = messages_.HookPart(
-        hook_id=label,
-        hook_type=payload.__name__,
-        status="pending",
-        metadata=hook_metadata,
-    )
+    hook_part = _hook_part(label, payload.__name__, "pending", hook_metadata)
 
     await rt.put_hook(hook_part)
 
@@ -140,18 +175,26 @@ async def _hook_impl(call: middleware_.HookContext) -> pydantic.BaseModel:
     # Clean up live registry.
     _live_hooks.pop(label, None)
 
+    # A payload instance is returned as-is; the signal still carries the
+    # plain-dict form.
+    validated = resolution if isinstance(resolution, payload) else None
+    if isinstance(resolution, pydantic.BaseModel):
+        resolution = resolution.model_dump()
+
     # Emit resolved signal.
     await rt.put_hook(
-        messages_.HookPart(
-            hook_id=label,
-            hook_type=payload.__name__,
-            status="resolved",
-            metadata=hook_metadata,
+        _hook_part(
+            label,
+            payload.__name__,
+            "resolved",
+            hook_metadata,
             resolution=resolution,
         )
     )
 
-    return payload(**resolution)
+    if validated is not None:
+        return validated
+    return payload.model_validate(resolution)
 
 
 def resolve_hook(
@@ -166,7 +209,10 @@ def resolve_hook(
 
     1. **Live hook exists** (long-running): validates data (if ``payload``
        type is provided), resolves the future immediately, unblocking the
-       awaiting coroutine.
+       awaiting coroutine.  Safe to call from another thread; the future
+       is then resolved on its own event loop, and a resolution that
+       arrives after the hook was already resolved or cancelled is
+       ignored.
 
     2. **No live hook yet** (serverless re-entry): stashes the resolution
        in the pre-registration registry.  When ``hook()`` executes during
@@ -186,34 +232,62 @@ def resolve_hook(
             when *data* is an exception.
 
     """
-    resolution: dict[str, Any] | BaseException
-    if isinstance(data, BaseException):
-        resolution = data
-    elif isinstance(data, pydantic.BaseModel):
-        resolution = data.model_dump()
-    elif isinstance(data, dict):
-        if payload is not None:
-            # Validate against the payload type.
-            validated = payload(**data)
-            resolution = validated.model_dump()
-        else:
-            resolution = data
-    else:
+    if not isinstance(data, BaseException | pydantic.BaseModel | dict):
         raise TypeError(
             f"Expected dict or pydantic model, got {type(data).__name__}"
         )
+    if isinstance(data, dict) and payload is not None:
+        # Validate against the payload type.
+        data = payload.model_validate(data)
 
     # Path 1: live hook — resolve the future directly.
-    if label in _live_hooks:
-        future, _, _rt = _live_hooks[label]
-        if isinstance(resolution, BaseException):
-            future.set_exception(resolution)
+    live = _live_hooks.get(label)
+    if live is not None:
+        future = live[0]
+        loop = future.get_loop()
+        try:
+            running: asyncio.AbstractEventLoop | None = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            running = None
+        if running is loop:
+            _settle(future, data)
         else:
-            future.set_result(resolution)
+            # Called from another thread (or another loop): hand off to
+            # the loop that owns the future.  By the time the callback
+            # runs the hook may already be resolved or cancelled, so it
+            # must tolerate a settled future.
+            loop.call_soon_threadsafe(_settle_if_pending, future, data)
         return
 
-    # Path 2: no live hook — pre-register for later consumption.
-    _pending_resolutions[label] = resolution
+    # Path 2: no live hook — pre-register for later consumption.  Models
+    # are stashed as-is so the replaying hook() can skip re-validation.
+    _pending_resolutions[label] = data
+
+
+def _settle(
+    future: asyncio.Future[dict[str, Any] | pydantic.BaseModel],
+    data: pydantic.BaseModel | dict[str, Any] | BaseException,
+) -> None:
+    if isinstance(data, BaseException):
+        future.set_exception(data)
+    else:
+        future.set_result(data)
+
+
+def _settle_if_pending(
+    future: asyncio.Future[dict[str, Any] | pydantic.BaseModel],
+    data: pydantic.BaseModel | dict[str, Any] | BaseException,
+) -> None:
+    """Cross-thread variant of :func:`_settle`: a late resolution is dropped.
+
+    Once scheduled there is no caller left to raise to, so a future that
+    was settled in the meantime (a second resolve, or ``cancel_hook``)
+    keeps its first outcome.
+    """
+    if not future.done():
+        _settle(future, data)
 
 
 def abort_pending_hook(hook_part: messages_.HookPart[Any]) -> None:
@@ -235,20 +309,17 @@ async def cancel_hook(label: str, *, reason: str | None = None) -> None:
     Only works for live hooks (long-running mode).  Raises ValueError
     if the hook is not currently pending.
     """
-    if label not in _live_hooks:
+    live = _live_hooks.pop(label, None)
+    if live is None:
         raise ValueError(f"No pending hook with label: {label!r}")
 
-    future, hook_metadata, rt = _live_hooks.pop(label)
+    future, hook_metadata, rt = live
     future.cancel(reason)
 
     # Emit cancelled signal.
     await rt.put_hook(
-        messages_.HookPart(
-            hook_id=label,
-            hook_type="",  # not available at cancel site
-            status="cancelled",
-            metadata=hook_metadata,
-        )
+        # hook_type is not available at the cancel site.
+        _hook_part(label, "", "cancelled", hook_metadata)
     )
 
 
@@ -19,11 +19,6 @@ if TYPE_CHECKING:
 class Runtime:
     """Central event queue. Producers put events, run() yields them."""
 
-    class _Sentinel:
-        pass
-
-    _SENTINEL = _Sentinel()
-
     def __init__(self) -> None:
         self._event_queue: util.AsyncIterableQueue[events_.AgentEvent] = (
             util.AsyncIterableQueue()
@@ -34,8 +29,13 @@ class Runtime:
         await self._event_queue.put(event)
 
     async def put_hook(self, hook_part: messages_.HookPart[Any]) -> None:
-        msg = messages_.Message(role="internal", parts=[hook_part])
-        await self.put_event(events_.HookEvent(message=msg, hook=hook_part))
+        # Trusted, locally built fields — skip validation.
+        msg = messages_.Message.model_construct(
+            role="internal", parts=[hook_part]
+        )
+        await self.put_event(
+            events_.HookEvent.model_construct(message=msg, hook=hook_part)
+        )
 
     async def signal_done(self) -> None:
         await self._event_queue.astop()
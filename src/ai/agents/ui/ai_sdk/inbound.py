@@ -281,14 +281,15 @@ def _patch_pending_hook_aborts(
     assistant_msg = messages[-2]
     if tool_msg.role != "tool" or assistant_msg.role != "assistant":
         return
-    if not assistant_msg.tool_calls:
+    tool_calls = assistant_msg.tool_calls
+    if not tool_calls:
         return
 
     hooks = {a.tool_call_id: a for a in approvals}
     completed_ids = {r.tool_call_id for r in tool_msg.tool_results}
 
     new_parts: list[messages_.Part] = list(tool_msg.parts)
-    for tc in assistant_msg.tool_calls:
+    for tc in tool_calls:
         if tc.tool_call_id in completed_ids:
             continue
         if not (hook := hooks.get(tc.tool_call_id)):
@@ -24,7 +24,12 @@ from ... import types
 from ...types import integrity
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterator,
+        Callable,
+        Sequence,
+    )
 
     from ...providers import base as provider_base
     from . import model as model_
@@ -76,6 +81,10 @@ class Executor:
         self,
         request: StreamRequest,
     ) -> AsyncGenerator[types.events.Event]:
+        # Provider.stream() is a plain method that can raise before it
+        # returns a generator (no protocol, uninitialized client).  Calling
+        # it from inside this generator keeps those errors on the first
+        # __anext__ rather than on entering ``stream()``.
         async for ev in request.model.provider.stream(
             request.model,
             request.messages,
@@ -191,149 +200,188 @@ class Stream(Generic[StreamOutputT]):
         )
 
     def _aggregate_event(self, event: types.events.Event) -> dict[str, Any]:
-        updates: dict[str, Any] = {}
-
         # Replay events carry no new state — the seeded message already
         # has everything they would have produced.
         if event.replay:
-            return updates
+            return {}
 
         # grab usage from any event that carries one
         if event.usage is not None:
             self._message.usage = event.usage
 
-        match event:
-            case types.events.TextStart(block_id=bid, provider_metadata=pm):
-                tp = types.messages.TextPart(
-                    id=bid, text="", provider_metadata=pm
-                )
-                self._message.parts.append(tp)
-                self._parts[bid] = tp
-            case types.events.TextDelta(
-                block_id=bid, chunk=c, provider_metadata=pm
-            ):
-                existing_text = self._parts.get(bid)
-                if isinstance(existing_text, types.messages.TextPart):
-                    existing_text.text += c
-                    if pm is not None:
-                        existing_text.provider_metadata = pm
-            case types.events.TextEnd(block_id=bid, provider_metadata=pm):
-                existing_text = self._parts.get(bid)
-                if (
-                    isinstance(existing_text, types.messages.TextPart)
-                    and pm is not None
-                ):
-                    existing_text.provider_metadata = pm
-            case types.events.ReasoningStart(
-                block_id=bid, provider_metadata=pm
-            ):
-                rp = types.messages.ReasoningPart(
-                    id=bid, text="", provider_metadata=pm
-                )
-                self._message.parts.append(rp)
-                self._parts[bid] = rp
-            case types.events.ReasoningDelta(
-                block_id=bid, chunk=c, provider_metadata=pm
-            ):
-                existing_reasoning = self._parts.get(bid)
-                if isinstance(existing_reasoning, types.messages.ReasoningPart):
-                    existing_reasoning.text += c
-                    if pm is not None:
-                        existing_reasoning.provider_metadata = pm
-            case types.events.ReasoningEnd(block_id=bid, provider_metadata=pm):
-                existing_reasoning = self._parts.get(bid)
-                if (
-                    isinstance(existing_reasoning, types.messages.ReasoningPart)
-                    and pm is not None
-                ):
-                    existing_reasoning.provider_metadata = pm
-            case types.events.ToolStart(
-                tool_call_id=tcid, tool_name=name, provider_metadata=pm
-            ):
-                tcp = types.messages.ToolCallPart(
-                    id=tcid,
-                    tool_call_id=tcid,
-                    tool_name=name,
-                    tool_args="",
-                    provider_metadata=pm,
-                )
-                self._message.parts.append(tcp)
-                self._parts[tcid] = tcp
-            case types.events.ToolDelta(
-                tool_call_id=tcid, chunk=c, provider_metadata=pm
-            ):
-                existing_tool = self._parts.get(tcid)
-                if isinstance(existing_tool, types.messages.ToolCallPart):
-                    existing_tool.tool_args += c
-                    if pm is not None:
-                        existing_tool.provider_metadata = pm
-
-            case types.events.ToolEnd(tool_call_id=tcid, provider_metadata=pm):
-                existing_tool = self._parts.get(tcid)
-                if isinstance(existing_tool, types.messages.ToolCallPart):
-                    updates["tool_call"] = existing_tool
-                    if pm is not None:
-                        existing_tool.provider_metadata = pm
-            case types.events.BuiltinToolStart(
-                tool_call_id=tcid,
-                tool_name=name,
-                provider_metadata=pm,
-            ):
-                btcp = types.messages.BuiltinToolCallPart(
-                    id=tcid,
-                    tool_call_id=tcid,
-                    tool_name=name,
-                    tool_args="",
-                    provider_metadata=pm,
-                )
-                self._message.parts.append(btcp)
-                self._parts[tcid] = btcp
-            case types.events.BuiltinToolDelta(
-                tool_call_id=tcid, chunk=c, provider_metadata=pm
-            ):
-                existing_btc = self._parts.get(tcid)
-                if isinstance(existing_btc, types.messages.BuiltinToolCallPart):
-                    existing_btc.tool_args += c
-                    if pm is not None:
-                        existing_btc.provider_metadata = pm
-            case types.events.BuiltinToolEnd(
-                tool_call_id=tcid, provider_metadata=pm
-            ):
-                existing_btc = self._parts.get(tcid)
-                if isinstance(existing_btc, types.messages.BuiltinToolCallPart):
-                    updates["tool_call"] = existing_btc
-                    if pm is not None:
-                        existing_btc.provider_metadata = pm
-            case types.events.BuiltinToolResult(
-                result=res, provider_metadata=pm
-            ):
-                if pm is not None:
-                    res = res.model_copy(update={"provider_metadata": pm})
-                self._message.parts.append(res)
-            case types.events.FileEvent(
-                block_id=bid,
-                media_type=mt,
-                data=d,
-                filename=fname,
-                provider_metadata=pm,
-            ):
-                fp = types.messages.FilePart(
-                    id=bid or types.messages.generate_id(),
-                    data=d,
-                    media_type=mt,
-                    filename=fname,
-                    provider_metadata=pm,
-                )
-                self._message.parts.append(fp)
-                self._parts[fp.id] = fp
-
-            case types.events.StreamEnd(provider_metadata=pm):
-                if pm is not None:
-                    self._message.provider_metadata = pm
-            case _:
-                pass
-
-        return updates
+        # One dict lookup on the exact event type instead of walking a
+        # ``match`` statement case by case for every token.
+        handler = _AGGREGATORS.get(type(event))
+        if handler is None:
+            return {}
+        return handler(self, event) or {}
+
+    # -- Aggregation handlers -------------------------------------------
+    #
+    # Parts opened below are built with ``model_construct``: every field
+    # comes from an already-validated event.  Handlers return the extra
+    # fields to set on the yielded event copy, or ``None``.
+
+    def _open_part(self, key: str, part: types.messages.Part) -> None:
+        self._message.parts.append(part)
+        self._parts[key] = part
+
+    def _on_text_start(self, event: types.events.TextStart) -> None:
+        self._open_part(
+            event.block_id,
+            types.messages.TextPart.model_construct(
+                id=event.block_id,
+                text="",
+                provider_metadata=event.provider_metadata,
+            ),
+        )
+
+    def _on_text_delta(self, event: types.events.TextDelta) -> None:
+        part = self._parts.get(event.block_id)
+        if isinstance(part, types.messages.TextPart):
+            part.text += event.chunk
+            if event.provider_metadata is not None:
+                part.provider_metadata = event.provider_metadata
+
+    def _on_text_end(self, event: types.events.TextEnd) -> None:
+        part = self._parts.get(event.block_id)
+        if (
+            isinstance(part, types.messages.TextPart)
+            and event.provider_metadata is not None
+        ):
+            part.provider_metadata = event.provider_metadata
+
+    def _on_reasoning_start(self, event: types.events.ReasoningStart) -> None:
+        self._open_part(
+            event.block_id,
+            types.messages.ReasoningPart.model_construct(
+                id=event.block_id,
+                text="",
+                provider_metadata=event.provider_metadata,
+            ),
+        )
+
+    def _on_reasoning_delta(self, event: types.events.ReasoningDelta) -> None:
+        part = self._parts.get(event.block_id)
+        if isinstance(part, types.messages.ReasoningPart):
+            part.text += event.chunk
+            if event.provider_metadata is not None:
+                part.provider_metadata = event.provider_metadata
+
+    def _on_reasoning_end(self, event: types.events.ReasoningEnd) -> None:
+        part = self._parts.get(event.block_id)
+        if (
+            isinstance(part, types.messages.ReasoningPart)
+            and event.provider_metadata is not None
+        ):
+            part.provider_metadata = event.provider_metadata
+
+    def _on_tool_start(self, event: types.events.ToolStart) -> None:
+        self._open_part(
+            event.tool_call_id,
+            types.messages.ToolCallPart.model_construct(
+                id=event.tool_call_id,
+                tool_call_id=event.tool_call_id,
+                tool_name=event.tool_name,
+                tool_args="",
+                provider_metadata=event.provider_metadata,
+            ),
+        )
+
+    def _on_tool_delta(self, event: types.events.ToolDelta) -> None:
+        part = self._parts.get(event.tool_call_id)
+        if isinstance(part, types.messages.ToolCallPart):
+            part.tool_args += event.chunk
+            if event.provider_metadata is not None:
+                part.provider_metadata = event.provider_metadata
+
+    def _on_tool_end(
+        self, event: types.events.ToolEnd
+    ) -> dict[str, Any] | None:
+        part = self._parts.get(event.tool_call_id)
+        if not isinstance(part, types.messages.ToolCallPart):
+            return None
+        if event.provider_metadata is not None:
+            part.provider_metadata = event.provider_metadata
+        return {"tool_call": part}
+
+    def _on_builtin_tool_start(
+        self, event: types.events.BuiltinToolStart
+    ) -> None:
+        self._open_part(
+            event.tool_call_id,
+            types.messages.BuiltinToolCallPart.model_construct(
+                id=event.tool_call_id,
+                tool_call_id=event.tool_call_id,
+                tool_name=event.tool_name,
+                tool_args="",
+                provider_metadata=event.provider_metadata,
+            ),
+        )
+
+    def _on_builtin_tool_delta(
+        self, event: types.events.BuiltinToolDelta
+    ) -> None:
+        part = self._parts.get(event.tool_call_id)
+        if isinstance(part, types.messages.BuiltinToolCallPart):
+            part.tool_args += event.chunk
+            if event.provider_metadata is not None:
+                part.provider_metadata = event.provider_metadata
+
+    def _on_builtin_tool_end(
+        self, event: types.events.BuiltinToolEnd
+    ) -> dict[str, Any] | None:
+        part = self._parts.get(event.tool_call_id)
+        if not isinstance(part, types.messages.BuiltinToolCallPart):
+            return None
+        if event.provider_metadata is not None:
+            part.provider_metadata = event.provider_metadata
+        return {"tool_call": part}
+
+    def _on_builtin_tool_result(
+        self, event: types.events.BuiltinToolResult
+    ) -> None:
+        result = event.result
+        if event.provider_metadata is not None:
+            result = result.model_copy(
+                update={"provider_metadata": event.provider_metadata}
+            )
+        self._message.parts.append(result)
+
+    def _on_file(self, event: types.events.FileEvent) -> None:
+        part = types.messages.FilePart(
+            id=event.block_id or types.messages.generate_id(),
+            data=event.data,
+            media_type=event.media_type,
+            filename=event.filename,
+            provider_metadata=event.provider_metadata,
+        )
+        self._open_part(part.id, part)
+
+    def _on_stream_end(self, event: types.events.StreamEnd) -> None:
+        if event.provider_metadata is not None:
+            self._message.provider_metadata = event.provider_metadata
+
+
+type _Aggregator = Callable[[Stream[Any], Any], dict[str, Any] | None]
+
+_AGGREGATORS: dict[type[types.events.Event], _Aggregator] = {
+    types.events.TextStart: Stream._on_text_start,
+    types.events.TextDelta: Stream._on_text_delta,
+    types.events.TextEnd: Stream._on_text_end,
+    types.events.ReasoningStart: Stream._on_reasoning_start,
+    types.events.ReasoningDelta: Stream._on_reasoning_delta,
+    types.events.ReasoningEnd: Stream._on_reasoning_end,
+    types.events.ToolStart: Stream._on_tool_start,
+    types.events.ToolDelta: Stream._on_tool_delta,
+    types.events.ToolEnd: Stream._on_tool_end,
+    types.events.BuiltinToolStart: Stream._on_builtin_tool_start,
+    types.events.BuiltinToolDelta: Stream._on_builtin_tool_delta,
+    types.events.BuiltinToolEnd: Stream._on_builtin_tool_end,
+    types.events.BuiltinToolResult: Stream._on_builtin_tool_result,
+    types.events.FileEvent: Stream._on_file,
+    types.events.StreamEnd: Stream._on_stream_end,
+}
 
 
 async def _replay_tool_calls(
@@ -481,9 +529,12 @@ async def _stream(
 ) -> AsyncIterator[Stream[Any]]:
     if messages and messages[-1].replay:
         last = messages[-1]
+        # Replay events are never aggregated into the seed, so it only
+        # needs its own ``parts`` list to keep the history's message
+        # untouched; deep-copying every part is unnecessary.
         s: Stream[Any] = Stream(
             _replay_tool_calls(last),
-            seed_message=last.model_copy(deep=True),
+            seed_message=last.model_copy(update={"parts": list(last.parts)}),
             output_type=cast("type[Any] | None", output_type),
         )
     else:
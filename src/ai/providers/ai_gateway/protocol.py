@@ -12,7 +12,7 @@ from typing import Any
 import httpx
 import pydantic
 
-from ... import types
+from ... import types, util
 from ...models import core
 from .. import base
 from ..anthropic import tools as anthropic_tools
@@ -126,7 +126,9 @@ async def _messages_to_prompt(
                             )
                         case types.messages.ToolCallPart() as tp:
                             tool_input: Any = (
-                                json.loads(tp.tool_args) if tp.tool_args else {}
+                                util.parse_json(tp.tool_args)
+                                if tp.tool_args
+                                else {}
                             )
                             assistant_content.append(
                                 {
@@ -138,7 +140,7 @@ async def _messages_to_prompt(
                             )
                         case types.messages.BuiltinToolCallPart() as btp:
                             btp_input: Any = (
-                                json.loads(btp.tool_args)
+                                util.parse_json(btp.tool_args)
                                 if btp.tool_args
                                 else {}
                             )
@@ -7,8 +7,9 @@ Anthropic-compatible providers own the SDK client used by this protocol.
 from __future__ import annotations
 
 import base64
+import dataclasses
 import json
-from collections.abc import AsyncGenerator, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, cast
 
 import pydantic
@@ -26,6 +27,9 @@ if TYPE_CHECKING:
 
 PROVIDER_NAME = "anthropic"
 
+# The Messages API requires ``max_tokens``; used unless params set one.
+_DEFAULT_MAX_TOKENS = 8192
+
 # Anthropic block types that carry server-tool results. We track these
 # so multi-turn message mapping can round-trip them back to the API.
 _TOOL_RESULT_BLOCK_TYPES: frozenset[str] = frozenset(
@@ -179,6 +183,97 @@ def _file_part_to_anthropic(
     raise ValueError(f"Unsupported media type for Anthropic: {mt}")
 
 
+def _reasoning_to_anthropic(
+    part: types.messages.ReasoningPart,
+) -> dict[str, Any] | None:
+    # Thinking blocks can only be replayed with their signature.
+    signature = (part.provider_metadata or {}).get("signature")
+    if not signature:
+        return None
+    return {
+        "type": "thinking",
+        "thinking": part.text,
+        "signature": signature,
+    }
+
+
+def _text_to_anthropic(part: types.messages.TextPart) -> dict[str, Any]:
+    return {"type": "text", "text": part.text}
+
+
+def _tool_call_to_anthropic(
+    part: types.messages.ToolCallPart,
+) -> dict[str, Any]:
+    return {
+        "type": "tool_use",
+        "id": part.tool_call_id,
+        "name": part.tool_name,
+        "input": json.loads(part.tool_args) if part.tool_args else {},
+    }
+
+
+def _builtin_tool_call_to_anthropic(
+    part: types.messages.BuiltinToolCallPart,
+) -> dict[str, Any]:
+    return {
+        "type": "server_tool_use",
+        "id": part.tool_call_id,
+        "name": part.tool_name,
+        "input": json.loads(part.tool_args) if part.tool_args else {},
+    }
+
+
+def _builtin_tool_return_to_anthropic(
+    part: types.messages.BuiltinToolReturnPart,
+) -> dict[str, Any]:
+    # Result block type comes from the original wire event
+    # ("web_search_tool_result", etc.); stored in provider metadata
+    # when emitted.
+    part_metadata = part.provider_metadata or {}
+    wire_type = (
+        part_metadata.get("resultType") or f"{part.tool_name}_tool_result"
+    )
+    return {
+        "type": wire_type,
+        "tool_use_id": part.tool_call_id,
+        "content": part.result,
+    }
+
+
+# Assistant part type -> content block converter.  Parts are almost
+# always the concrete members of the ``Part`` union, so a single dict
+# lookup replaces walking a ``match`` ladder per part; subclasses are
+# resolved through their MRO by ``_assistant_part_handler``.  Parts
+# without an entry (tool results, hooks, files) have no assistant-side
+# wire form and are skipped.
+_ASSISTANT_PART_HANDLERS: dict[
+    type[Any], Callable[[Any], dict[str, Any] | None]
+] = {
+    types.messages.ReasoningPart: _reasoning_to_anthropic,
+    types.messages.TextPart: _text_to_anthropic,
+    types.messages.ToolCallPart: _tool_call_to_anthropic,
+    types.messages.BuiltinToolCallPart: _builtin_tool_call_to_anthropic,
+    types.messages.BuiltinToolReturnPart: _builtin_tool_return_to_anthropic,
+}
+
+
+def _assistant_part_handler(
+    part_type: type[Any],
+) -> Callable[[Any], dict[str, Any] | None] | None:
+    """Return the handler for *part_type*, falling back along its MRO.
+
+    The exact-type hit is the common case; walking the MRO keeps
+    subclassed parts converting the way the ``isinstance`` checks did.
+    """
+    handler = _ASSISTANT_PART_HANDLERS.get(part_type)
+    if handler is None:
+        for base in part_type.__mro__[1:]:
+            handler = _ASSISTANT_PART_HANDLERS.get(base)
+            if handler is not None:
+                break
+    return handler
+
+
 async def _messages_to_anthropic(
     messages: list[types.messages.Message],
 ) -> tuple[str | None, list[dict[str, Any]]]:
@@ -194,76 +289,16 @@ async def _messages_to_anthropic(
     for msg in messages:
         match msg.role:
             case "system":
-                system_prompt = "".join(
-                    p.text
-                    for p in msg.parts
-                    if isinstance(p, types.messages.TextPart)
-                )
+                system_prompt = msg.text
             case "assistant":
                 content: list[dict[str, Any]] = []
                 for part in msg.parts:
-                    match part:
-                        case types.messages.ReasoningPart(
-                            text=text,
-                            provider_metadata=provider_metadata,
-                        ):
-                            signature = (provider_metadata or {}).get(
-                                "signature"
-                            )
-                            if signature:
-                                content.append(
-                                    {
-                                        "type": "thinking",
-                                        "thinking": text,
-                                        "signature": signature,
-                                    }
-                                )
-                        case types.messages.TextPart(text=text):
-                            content.append({"type": "text", "text": text})
-                        case types.messages.ToolCallPart():
-                            tool_input = (
-                                json.loads(part.tool_args)
-                                if part.tool_args
-                                else {}
-                            )
-                            content.append(
-                                {
-                                    "type": "tool_use",
-                                    "id": part.tool_call_id,
-                                    "name": part.tool_name,
-                                    "input": tool_input,
-                                }
-                            )
-                        case types.messages.BuiltinToolCallPart():
-                            btc_input = (
-                                json.loads(part.tool_args)
-                                if part.tool_args
-                                else {}
-                            )
-                            content.append(
-                                {
-                                    "type": "server_tool_use",
-                                    "id": part.tool_call_id,
-                                    "name": part.tool_name,
-                                    "input": btc_input,
-                                }
-                            )
-                        case types.messages.BuiltinToolReturnPart():
-                            # Result block type comes from the original wire
-                            # event ("web_search_tool_result", etc.); stored in
-                            # provider metadata when emitted.
-                            part_metadata = part.provider_metadata or {}
-                            wire_type = (
-                                part_metadata.get("resultType")
-                                or f"{part.tool_name}_tool_result"
-                            )
-                            content.append(
-                                {
-                                    "type": wire_type,
-                                    "tool_use_id": part.tool_call_id,
-                                    "content": part.result,
-                                }
-                            )
+                    handler = _assistant_part_handler(type(part))
+                    if handler is None:
+                        continue
+                    block = handler(part)
+                    if block is not None:
+                        content.append(block)
                 if content:
                     result.append({"role": "assistant", "content": content})
 
@@ -290,12 +325,7 @@ async def _messages_to_anthropic(
                     isinstance(p, types.messages.FilePart) for p in msg.parts
                 )
                 if not has_files:
-                    content_text = "".join(
-                        p.text
-                        for p in msg.parts
-                        if isinstance(p, types.messages.TextPart)
-                    )
-                    result.append({"role": "user", "content": content_text})
+                    result.append({"role": "user", "content": msg.text})
                 else:
                     user_content: list[dict[str, Any]] = []
                     for p in msg.parts:
@@ -319,18 +349,30 @@ def _merge_consecutive_roles(
 
     Anthropic requires strictly alternating user/assistant roles.
     """
-    if not messages:
+    # Common first-turn shape: a single user message, nothing to merge.
+    if len(messages) < 2:
         return messages
 
     merged: list[dict[str, Any]] = [messages[0]]
+    last = messages[0]
 
-    for msg in messages[1:]:
-        if msg["role"] == merged[-1]["role"]:
-            prev = _to_content_list(merged[-1]["content"])
-            cur = _to_content_list(msg["content"])
-            merged[-1]["content"] = prev + cur
-        else:
+    for i in range(1, len(messages)):
+        msg = messages[i]
+        if msg["role"] != last["role"]:
             merged.append(msg)
+            last = msg
+            continue
+        # The dicts were built by ``_messages_to_anthropic`` for this
+        # request, so the merge target's block list can grow in place
+        # instead of being re-concatenated for every merged message.
+        content = last["content"]
+        if not isinstance(content, list):
+            content = last["content"] = _to_content_list(content)
+        cur = msg["content"]
+        if isinstance(cur, list):
+            content.extend(cur)
+        else:
+            content.append({"type": "text", "text": cur})
 
     return merged
 
@@ -381,6 +423,207 @@ def _result_block_content(block: Any) -> Any:
     return content
 
 
+# ---------------------------------------------------------------------------
+# Stream event handlers — Anthropic SDK events → internal events
+#
+# Each handler maps one SDK event to at most one internal event.  The
+# stream loop looks handlers up by ``event.type`` (and deltas by
+# ``delta.type``) in a dict rather than walking a chain of string
+# compares for every event of a long generation.
+# ---------------------------------------------------------------------------
+
+
+@dataclasses.dataclass
+class _StreamState:
+    """Per-request bookkeeping shared by the stream event handlers.
+
+    Anthropic indexes content blocks by int; map to string block_ids.
+    The string form is built once per block on ``content_block_start``
+    so the (far more frequent) delta events reuse it.
+    """
+
+    sdk_stream: Any
+    block_types: dict[int, str] = dataclasses.field(default_factory=dict)
+    block_ids: dict[int, str] = dataclasses.field(default_factory=dict)
+    tool_ids: dict[int, str] = dataclasses.field(default_factory=dict)
+    tool_names: dict[int, str] = dataclasses.field(default_factory=dict)
+    # Signature chunks per thinking block, joined once on block stop.
+    signature_buffer: dict[int, list[str]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def block_id(self, idx: int) -> str:
+        return self.block_ids.get(idx) or str(idx)
+
+
+type _EventHandler = Callable[[Any, _StreamState], events.Event | None]
+
+
+def _on_block_start(event: Any, state: _StreamState) -> events.Event | None:
+    block = event.content_block
+    idx = event.index
+    state.block_types[idx] = block.type
+    block_id = state.block_ids[idx] = str(idx)
+
+    match block.type:
+        case "text":
+            return events.TextStart(block_id=block_id)
+        case "thinking":
+            return events.ReasoningStart(block_id=block_id)
+        case "tool_use":
+            state.tool_ids[idx] = block.id
+            state.tool_names[idx] = block.name
+            return events.ToolStart(
+                tool_call_id=block.id,
+                tool_name=block.name,
+            )
+        case "server_tool_use":
+            state.tool_ids[idx] = block.id
+            state.tool_names[idx] = block.name
+            return events.BuiltinToolStart(
+                tool_call_id=block.id,
+                tool_name=block.name,
+                provider_metadata=_provider_metadata(),
+            )
+    # Result blocks (web_search_tool_result etc.) arrive complete; we
+    # emit on stop so we have full content.
+    return None
+
+
+def _on_text_delta(event: Any, state: _StreamState) -> events.Event | None:
+    return events.TextDelta(
+        chunk=event.delta.text,
+        block_id=state.block_id(event.index),
+    )
+
+
+def _on_thinking_delta(event: Any, state: _StreamState) -> events.Event | None:
+    return events.ReasoningDelta(
+        chunk=event.delta.thinking,
+        block_id=state.block_id(event.index),
+    )
+
+
+def _on_signature_delta(event: Any, state: _StreamState) -> events.Event | None:
+    state.signature_buffer.setdefault(event.index, []).append(
+        event.delta.signature
+    )
+    return None
+
+
+def _on_input_json_delta(
+    event: Any, state: _StreamState
+) -> events.Event | None:
+    idx = event.index
+    tool_id = state.tool_ids.get(idx)
+    if not tool_id:
+        return None
+    if state.block_types.get(idx) == "server_tool_use":
+        return events.BuiltinToolDelta(
+            chunk=event.delta.partial_json,
+            tool_call_id=tool_id,
+        )
+    return events.ToolDelta(
+        chunk=event.delta.partial_json,
+        tool_call_id=tool_id,
+    )
+
+
+_DELTA_HANDLERS: dict[str, _EventHandler] = {
+    "text_delta": _on_text_delta,
+    "thinking_delta": _on_thinking_delta,
+    "signature_delta": _on_signature_delta,
+    "input_json_delta": _on_input_json_delta,
+}
+
+
+def _on_block_delta(event: Any, state: _StreamState) -> events.Event | None:
+    handler = _DELTA_HANDLERS.get(event.delta.type)
+    if handler is None:
+        return None
+    return handler(event, state)
+
+
+def _on_block_stop(event: Any, state: _StreamState) -> events.Event | None:
+    idx = event.index
+    block_type = state.block_types.get(idx)
+    if block_type == "text":
+        return events.TextEnd(block_id=state.block_id(idx))
+    if block_type == "thinking":
+        chunks = state.signature_buffer.pop(idx, None)
+        signature = "".join(chunks) if chunks is not None else None
+        return events.ReasoningEnd(
+            block_id=state.block_id(idx),
+            provider_metadata=(
+                _provider_metadata(signature=signature)
+                if signature is not None
+                else None
+            ),
+        )
+    if block_type == "tool_use":
+        tool_id = state.tool_ids.get(idx)
+        if not tool_id:
+            return None
+        return events.ToolEnd(
+            tool_call_id=tool_id,
+            tool_call=types.messages.DUMMY_TOOL_CALL,
+        )
+    if block_type == "server_tool_use":
+        tool_id = state.tool_ids.get(idx)
+        if not tool_id:
+            return None
+        return events.BuiltinToolEnd(
+            tool_call_id=tool_id,
+            tool_call=types.messages.BuiltinToolCallPart(
+                tool_call_id=tool_id,
+                tool_name=state.tool_names.get(idx, ""),
+                provider_metadata=_provider_metadata(),
+            ),
+        )
+    if block_type in _TOOL_RESULT_BLOCK_TYPES:
+        return _tool_result_block_event(idx, block_type, state)
+    return None
+
+
+def _tool_result_block_event(
+    idx: int, block_type: str, state: _StreamState
+) -> events.Event | None:
+    # Look up the matching server_tool_use (by tool_use_id) from the
+    # snapshot so we have the canonical tool name.
+    snap = state.sdk_stream.current_message_snapshot
+    result_block = snap.content[idx] if idx < len(snap.content) else None
+    if result_block is None:
+        return None
+    tool_use_id = getattr(result_block, "tool_use_id", None) or ""
+    content_payload = _result_block_content(result_block)
+    # Look up the corresponding server_tool_use block to recover the
+    # tool name.
+    tool_name = ""
+    for cb in snap.content:
+        if (
+            getattr(cb, "type", None) == "server_tool_use"
+            and getattr(cb, "id", None) == tool_use_id
+        ):
+            tool_name = getattr(cb, "name", "") or ""
+            break
+    return events.BuiltinToolResult(
+        tool_call_id=tool_use_id,
+        result=types.messages.BuiltinToolReturnPart(
+            tool_call_id=tool_use_id,
+            tool_name=tool_name,
+            result=content_payload,
+            provider_metadata=_provider_metadata(resultType=block_type),
+        ),
+    )
+
+
+_EVENT_HANDLERS: dict[str, _EventHandler] = {
+    "content_block_start": _on_block_start,
+    "content_block_delta": _on_block_delta,
+    "content_block_stop": _on_block_stop,
+}
+
+
 # ---------------------------------------------------------------------------
 # Public protocol function
 # ---------------------------------------------------------------------------
@@ -406,7 +649,9 @@ async def stream(
     request options are forwarded without local validation or translation.
     """
     anthropic_sdk = _sdk.import_sdk(provider=provider)
-    stream_params = _coerce_params(params)
+    # ``_coerce_params`` returns a fresh dict owned by this request, so
+    # it doubles as the SDK kwargs without another copy.
+    api_kwargs = _coerce_params(params)
     system_prompt, anthropic_messages = await _messages_to_anthropic(messages)
 
     custom_tools, builtin_tools = _split_tools(tools or ())
@@ -418,14 +663,9 @@ async def stream(
         builtin_wire, builtin_betas = _builtin_tools_to_anthropic(builtin_tools)
         wire_tools.extend(builtin_wire)
 
-    api_kwargs: dict[str, Any] = dict(stream_params)
-    api_kwargs.setdefault("max_tokens", 8192)
-    api_kwargs.update(
-        {
-            "model": model.id,
-            "messages": anthropic_messages,
-        }
-    )
+    api_kwargs.setdefault("max_tokens", _DEFAULT_MAX_TOKENS)
+    api_kwargs["model"] = model.id
+    api_kwargs["messages"] = anthropic_messages
     if system_prompt:
         api_kwargs["system"] = system_prompt
     if wire_tools:
@@ -436,169 +676,26 @@ async def stream(
     if output_type is not None:
         api_kwargs["output_format"] = output_type
 
-    # Anthropic indexes content blocks by int; map to string block_ids.
-    block_types: dict[int, str] = {}
-    tool_ids: dict[int, str] = {}
-    tool_names: dict[int, str] = {}
-    signature_buffer: dict[int, str] = {}
-
     try:
         async with sdk_client.messages.stream(**api_kwargs) as sdk_stream:
             yield events.StreamStart()
 
+            state = _StreamState(sdk_stream)
             async for event in sdk_stream:
-                match event.type:
-                    case "content_block_start":
-                        event = cast("Any", event)
-                        block = event.content_block
-                        idx = event.index
-                        block_types[idx] = block.type
-
-                        match block.type:
-                            case "text":
-                                yield events.TextStart(block_id=str(idx))
-                            case "thinking":
-                                yield events.ReasoningStart(block_id=str(idx))
-                            case "tool_use":
-                                tool_ids[idx] = block.id
-                                tool_names[idx] = block.name
-                                yield events.ToolStart(
-                                    tool_call_id=block.id,
-                                    tool_name=block.name,
-                                )
-                            case "server_tool_use":
-                                tool_ids[idx] = block.id
-                                tool_names[idx] = block.name
-                                yield events.BuiltinToolStart(
-                                    tool_call_id=block.id,
-                                    tool_name=block.name,
-                                    provider_metadata=_provider_metadata(),
-                                )
-                            # Result blocks (web_search_tool_result etc.) arrive
-                            # complete; we emit on stop so we have full content.
-
-                    case "content_block_delta":
-                        event = cast("Any", event)
-                        delta = event.delta
-                        idx = event.index
-
-                        match delta.type:
-                            case "text_delta":
-                                yield events.TextDelta(
-                                    chunk=delta.text,
-                                    block_id=str(idx),
-                                )
-                            case "thinking_delta":
-                                yield events.ReasoningDelta(
-                                    chunk=delta.thinking,
-                                    block_id=str(idx),
-                                )
-                            case "signature_delta":
-                                signature_buffer[idx] = (
-                                    signature_buffer.get(idx, "")
-                                    + delta.signature
-                                )
-                            case "input_json_delta":
-                                tool_id = tool_ids.get(idx)
-                                if not tool_id:
-                                    continue
-                                if block_types.get(idx) == "server_tool_use":
-                                    yield events.BuiltinToolDelta(
-                                        chunk=delta.partial_json,
-                                        tool_call_id=tool_id,
-                                    )
-                                else:
-                                    yield events.ToolDelta(
-                                        chunk=delta.partial_json,
-                                        tool_call_id=tool_id,
-                                    )
-
-                    case "content_block_stop":
-                        event = cast("Any", event)
-                        idx = event.index
-                        block_type = block_types.get(idx)
-                        if block_type == "text":
-                            yield events.TextEnd(block_id=str(idx))
-                        elif block_type == "thinking":
-                            signature = signature_buffer.get(idx)
-                            yield events.ReasoningEnd(
-                                block_id=str(idx),
-                                provider_metadata=(
-                                    _provider_metadata(signature=signature)
-                                    if signature is not None
-                                    else None
-                                ),
-                            )
-                        elif block_type == "tool_use":
-                            tool_id = tool_ids.get(idx)
-                            if tool_id:
-                                yield events.ToolEnd(
-                                    tool_call_id=tool_id,
-                                    tool_call=types.messages.DUMMY_TOOL_CALL,
-                                )
-                        elif block_type == "server_tool_use":
-                            tool_id = tool_ids.get(idx)
-                            if tool_id:
-                                yield events.BuiltinToolEnd(
-                                    tool_call_id=tool_id,
-                                    tool_call=types.messages.BuiltinToolCallPart(
-                                        tool_call_id=tool_id,
-                                        tool_name=tool_names.get(idx, ""),
-                                        provider_metadata=_provider_metadata(),
-                                    ),
-                                )
-                        elif block_type in _TOOL_RESULT_BLOCK_TYPES:
-                            # Look up the matching server_tool_use (by
-                            # tool_use_id) from the snapshot so we have
-                            # the canonical tool name.
-                            snap = sdk_stream.current_message_snapshot
-                            result_block = (
-                                snap.content[idx]
-                                if idx < len(snap.content)
-                                else None
-                            )
-                            if result_block is None:
-                                continue
-                            tool_use_id = (
-                                getattr(result_block, "tool_use_id", None) or ""
-                            )
-                            content_payload = _result_block_content(
-                                result_block
-                            )
-                            # Look up the corresponding server_tool_use
-                            # block to recover the tool name.
-                            tool_name = ""
-                            for cb in snap.content:
-                                if (
-                                    getattr(cb, "type", None)
-                                    == "server_tool_use"
-                                    and getattr(cb, "id", None) == tool_use_id
-                                ):
-                                    tool_name = getattr(cb, "name", "") or ""
-                                    break
-                            yield events.BuiltinToolResult(
-                                tool_call_id=tool_use_id,
-                                result=types.messages.BuiltinToolReturnPart(
-                                    tool_call_id=tool_use_id,
-                                    tool_name=tool_name,
-                                    result=content_payload,
-                                    provider_metadata=_provider_metadata(
-                                        resultType=block_type or ""
-                                    ),
-                                ),
-                            )
+                handler = _EVENT_HANDLERS.get(event.type)
+                if handler is None:
+                    continue
+                out = handler(cast("Any", event), state)
+                if out is not None:
+                    yield out
 
             snapshot = sdk_stream.current_message_snapshot
             sdk_usage = snapshot.usage
             usage = types.usage.Usage(
                 input_tokens=sdk_usage.input_tokens or 0,
                 output_tokens=sdk_usage.output_tokens or 0,
-                cache_read_tokens=getattr(
-                    sdk_usage, "cache_read_input_tokens", None
-                ),
-                cache_write_tokens=getattr(
-                    sdk_usage, "cache_creation_input_tokens", None
-                ),
+                cache_read_tokens=sdk_usage.cache_read_input_tokens,
+                cache_write_tokens=sdk_usage.cache_creation_input_tokens,
                 raw=sdk_usage.model_dump(exclude_none=True) or None,
             )
             yield events.StreamEnd(usage=usage)
@@ -1,4 +1,4 @@
-import uuid
+import secrets
 from typing import Annotated, Any, Literal, Self, overload
 
 import pydantic
@@ -8,8 +8,12 @@ from . import usage as usage_
 
 
 def generate_id(prefix: str | None = None) -> str:
-    """Generate a short random ID for messages and parts."""
-    raw = uuid.uuid4().hex[:12]
+    """Generate a short random ID for messages and parts.
+
+    Twelve hex characters (48 random bits) from ``secrets.token_hex``,
+    which is cheaper than building a full UUID only to truncate it.
+    """
+    raw = secrets.token_hex(6)
     return f"{prefix}_{raw}" if prefix else raw
 
 
@@ -236,13 +240,15 @@ class Message(pydantic.BaseModel):
     @property
     def text(self) -> str:
         """Concatenated text parts."""
-        return "".join(p.text for p in self.parts if isinstance(p, TextPart))
+        # ``str.join`` materializes its argument anyway; a list
+        # comprehension skips the generator frame.
+        return "".join([p.text for p in self.parts if isinstance(p, TextPart)])
 
     @property
     def reasoning(self) -> str:
         """Concatenated reasoning parts."""
         return "".join(
-            p.text for p in self.parts if isinstance(p, ReasoningPart)
+            [p.text for p in self.parts if isinstance(p, ReasoningPart)]
         )
 
     @property
@@ -289,12 +295,13 @@ class Message(pydantic.BaseModel):
         Raises :class:`ValueError` unless the message is a *final*
         assistant message: role ``"assistant"`` with no pending tool calls.
         """
-        if self.role != "assistant" or self.tool_calls:
+        tool_calls = self.tool_calls
+        if self.role != "assistant" or tool_calls:
             raise ValueError(
                 "get_output() requires a final assistant message "
                 "(role='assistant' with no tool calls); "
                 f"got role={self.role!r} with "
-                f"{len(self.tool_calls)} tool call(s)"
+                f"{len(tool_calls)} tool call(s)"
             )
         if output_type is None:
             return self.text
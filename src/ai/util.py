@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import dataclasses
+import json
 from typing import TYPE_CHECKING, Any
 
+import pydantic_core
+
 if TYPE_CHECKING:
     from collections.abc import AsyncIterable, AsyncIterator
 
@@ -207,3 +210,17 @@ async def merge[T](
                         niter = decouple(aiterables[idx], task_group=tg)
                         aiters[idx] = niter
                         tasks[idx] = tg.create_task(anext(niter, _EMPTY))
+
+
+def parse_json(data: str) -> Any:
+    """Parse *data* as JSON, preferring pydantic-core's native parser.
+
+    Input the native parser rejects but the standard library accepts
+    (lone surrogate escapes, nesting past its recursion limit) is retried
+    with :func:`json.loads`, so what is accepted, and the
+    ``json.JSONDecodeError`` raised for invalid JSON, match ``json.loads``.
+    """
+    try:
+        return pydantic_core.from_json(data)
+    except ValueError:
+        return json.loads(data)
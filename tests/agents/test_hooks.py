@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -57,6 +58,155 @@ async def test_resolve_live_future() -> None:
     assert resolved_value.reason == "looks good"
 
 
+async def test_resolve_live_future_with_model() -> None:
+    """A live hook resolved with a payload instance returns that instance."""
+    confirmation = Confirmation(approved=True, reason="ok")
+    resolved_value: Confirmation | None = None
+
+    class MyAgent(ai.Agent):
+        async def loop(
+            self, context: ai.Context
+        ) -> AsyncGenerator[ai.events.Event]:
+            nonlocal resolved_value
+            async with ai.models.stream(context=context) as stream:
+                async for event in stream:
+                    yield event
+            resolved_value = await ai.hook("confirm_2", payload=Confirmation)
+
+    my_agent = MyAgent()
+
+    mock_llm([[text_msg("OK")]])
+
+    hooks: list[ai.messages.HookPart[Any]] = []
+    async with my_agent.run(MOCK_MODEL, [ai.user_message("go")]) as stream:
+        async for event in stream:
+            if not isinstance(event, agent_events_.HookEvent):
+                continue
+            hooks.append(event.hook)
+            if event.hook.status == "pending":
+                ai.resolve_hook("confirm_2", confirmation)
+
+    assert resolved_value is confirmation
+    resolved = [h for h in hooks if h.status == "resolved"]
+    assert resolved[0].resolution == {"approved": True, "reason": "ok"}
+
+
+async def test_resolve_live_future_from_thread() -> None:
+    """resolve_hook() from another thread resolves on the hook's loop."""
+    resolved_value: Confirmation | None = None
+
+    class MyAgent(ai.Agent):
+        async def loop(
+            self, context: ai.Context
+        ) -> AsyncGenerator[ai.events.Event]:
+            nonlocal resolved_value
+            async with ai.models.stream(context=context) as stream:
+                async for event in stream:
+                    yield event
+            resolved_value = await ai.hook("confirm_3", payload=Confirmation)
+
+    my_agent = MyAgent()
+
+    mock_llm([[text_msg("OK")]])
+
+    async with my_agent.run(MOCK_MODEL, [ai.user_message("go")]) as stream:
+        async for event in stream:
+            if not isinstance(event, agent_events_.HookEvent):
+                continue
+            if event.hook.status == "pending":
+                await asyncio.to_thread(
+                    ai.resolve_hook, "confirm_3", {"approved": True}
+                )
+
+    assert resolved_value is not None
+    assert resolved_value.approved is True
+
+
+def _resolve_in_thread(label: str, data: dict[str, Any]) -> None:
+    """Call resolve_hook() from a worker thread while the loop is blocked.
+
+    The loop cannot run the scheduled callback until the caller yields,
+    which makes the cross-thread ordering deterministic.
+    """
+    thread = threading.Thread(target=ai.resolve_hook, args=(label, data))
+    thread.start()
+    thread.join()
+
+
+async def test_resolve_from_thread_twice_keeps_first() -> None:
+    """A second cross-thread resolve of the same hook is dropped quietly."""
+    resolved_value: Confirmation | None = None
+    loop_errors: list[dict[str, Any]] = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda _loop, ctx: loop_errors.append(ctx)
+    )
+
+    class MyAgent(ai.Agent):
+        async def loop(
+            self, context: ai.Context
+        ) -> AsyncGenerator[ai.events.Event]:
+            nonlocal resolved_value
+            async with ai.models.stream(context=context) as stream:
+                async for event in stream:
+                    yield event
+            resolved_value = await ai.hook("confirm_4", payload=Confirmation)
+
+    my_agent = MyAgent()
+
+    mock_llm([[text_msg("OK")]])
+
+    async with my_agent.run(MOCK_MODEL, [ai.user_message("go")]) as stream:
+        async for event in stream:
+            if not isinstance(event, agent_events_.HookEvent):
+                continue
+            if event.hook.status == "pending":
+                _resolve_in_thread("confirm_4", {"approved": True})
+                _resolve_in_thread("confirm_4", {"approved": False})
+
+    assert resolved_value is not None
+    assert resolved_value.approved is True
+    assert loop_errors == []
+
+
+async def test_resolve_from_thread_racing_cancel() -> None:
+    """A cross-thread resolve that lands after cancel_hook() is dropped."""
+    was_cancelled = False
+    loop_errors: list[dict[str, Any]] = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda _loop, ctx: loop_errors.append(ctx)
+    )
+
+    class MyAgent(ai.Agent):
+        async def loop(
+            self, context: ai.Context
+        ) -> AsyncGenerator[ai.events.Event]:
+            nonlocal was_cancelled
+            async with ai.models.stream(context=context) as stream:
+                async for event in stream:
+                    yield event
+            try:
+                await ai.hook("confirm_5", payload=Confirmation)
+            except asyncio.CancelledError:
+                was_cancelled = True
+
+    my_agent = MyAgent()
+
+    mock_llm([[text_msg("OK")]])
+
+    async with my_agent.run(MOCK_MODEL, [ai.user_message("go")]) as stream:
+        async for event in stream:
+            if not isinstance(event, agent_events_.HookEvent):
+                continue
+            if event.hook.status == "pending":
+                # The thread's callback is queued but cannot run before
+                # cancel_hook() cancels the future.
+                _resolve_in_thread("confirm_5", {"approved": True})
+                await ai.cancel_hook("confirm_5", reason="denied")
+
+    assert was_cancelled
+    assert loop_errors == []
+
+
 # -- cancel_hook() --------------------------------------------------------
 
 
@@ -130,6 +280,33 @@ async def test_pre_registered_resolution_consumed() -> None:
     assert resolved_value.approved is True
 
 
+async def test_pre_registered_model_returned_without_revalidation() -> None:
+    """A pre-registered payload instance is handed back as-is on replay."""
+    resolved_value: Confirmation | None = None
+
+    class MyAgent(ai.Agent):
+        async def loop(
+            self, context: ai.Context
+        ) -> AsyncGenerator[ai.events.Event]:
+            nonlocal resolved_value
+            async with ai.models.stream(context=context) as stream:
+                async for event in stream:
+                    yield event
+            resolved_value = await ai.hook("pre_reg_2", payload=Confirmation)
+
+    my_agent = MyAgent()
+
+    confirmation = Confirmation(approved=True, reason="ok")
+    ai.resolve_hook("pre_reg_2", confirmation)
+
+    mock_llm([[text_msg("OK")]])
+    async with my_agent.run(MOCK_MODEL, [ai.user_message("go")]) as stream:
+        async for _msg in stream:
+            pass
+
+    assert resolved_value is confirmation
+
+
 # -- Schema validation on resolve -----------------------------------------
 
 
@@ -210,3 +387,33 @@ async def test_hook_metadata_in_pending() -> None:
 
     assert len(hooks) >= 1
     assert hooks[0].metadata == {"tool": "rm -rf", "path": "/"}
+
+
+async def test_hook_parts_do_not_share_metadata() -> None:
+    class MyAgent(ai.Agent):
+        async def loop(
+            self, context: ai.Context
+        ) -> AsyncGenerator[ai.events.Event]:
+            async with ai.models.stream(context=context) as stream:
+                async for event in stream:
+                    yield event
+            await ai.hook(
+                "meta_copy",
+                payload=Confirmation,
+                metadata={"tool": "rm -rf"},
+            )
+
+    my_agent = MyAgent()
+
+    mock_llm([[text_msg("OK")]])
+    hooks: list[ai.messages.HookPart[Any]] = []
+    async with my_agent.run(MOCK_MODEL, [ai.user_message("go")]) as stream:
+        async for event in stream:
+            if isinstance(event, agent_events_.HookEvent):
+                hooks.append(event.hook)
+                if event.hook.status == "pending":
+                    event.hook.metadata["tool"] = "mutated"
+                    ai.resolve_hook("meta_copy", {"approved": True})
+
+    assert [h.status for h in hooks] == ["pending", "resolved"]
+    assert hooks[1].metadata == {"tool": "rm -rf"}
@@ -247,6 +247,15 @@ async def test_stream_requires_model_messages_or_context() -> None:
             pass
 
 
+async def test_stream_provider_errors_raise_on_first_event() -> None:
+    """Provider.stream() setup errors surface on iteration, not on entry."""
+    MOCK_PROVIDER._stream_impl = None
+
+    async with models.stream(MOCK_MODEL, [ai.user_message("Hi")]) as s:
+        with pytest.raises(RuntimeError, match="no stream implementation"):
+            await anext(s)
+
+
 async def test_stream_accepts_protocol_kwarg() -> None:
     class OverrideProtocol(models.ProviderProtocol[Any]):
         def stream(
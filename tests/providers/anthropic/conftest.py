@@ -25,9 +25,13 @@ class FakeUsage:
         *,
         input_tokens: int = 0,
         output_tokens: int = 0,
+        cache_read_input_tokens: int | None = None,
+        cache_creation_input_tokens: int | None = None,
     ) -> None:
         self.input_tokens = input_tokens
         self.output_tokens = output_tokens
+        self.cache_read_input_tokens = cache_read_input_tokens
+        self.cache_creation_input_tokens = cache_creation_input_tokens
 
     def model_dump(self, *, exclude_none: bool = False) -> dict[str, Any]:
         return {
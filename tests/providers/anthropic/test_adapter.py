@@ -268,3 +268,49 @@ async def test_model_404_is_mapped_to_model_not_found(
     assert exc.http_context.request is response.request
     assert exc.http_context.response is response
     assert exc.__cause__ is sdk_error
+
+
+async def test_tool_call_input_not_shared_across_requests() -> None:
+    call = messages.ToolCallPart(
+        tool_call_id="toolu_1",
+        tool_name="lookup",
+        tool_args='{"query": "weather"}',
+    )
+    convo = [
+        ai.user_message("Hi"),
+        messages.Message(role="assistant", parts=[call]),
+    ]
+
+    _, first = await protocol._messages_to_anthropic(convo)
+    _, second = await protocol._messages_to_anthropic(convo)
+
+    first_input = first[1]["content"][0]["input"]
+    assert first_input == {"query": "weather"}
+    first_input["query"] = "mutated"
+    assert second[1]["content"][0]["input"] == {"query": "weather"}
+
+
+async def test_subclassed_assistant_parts_are_converted() -> None:
+    class CustomToolCallPart(messages.ToolCallPart):
+        pass
+
+    call = CustomToolCallPart(
+        tool_call_id="toolu_1",
+        tool_name="lookup",
+        tool_args='{"query": "weather"}',
+    )
+    convo = [
+        ai.user_message("Hi"),
+        messages.Message(role="assistant", parts=[call]),
+    ]
+
+    _, result = await protocol._messages_to_anthropic(convo)
+
+    assert result[1]["content"] == [
+        {
+            "type": "tool_use",
+            "id": "toolu_1",
+            "name": "lookup",
+            "input": {"query": "weather"},
+        }
+    ]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import importlib
+import subprocess
+import sys
 
 import anthropic
 import httpx
@@ -173,6 +175,18 @@ def test_get_provider_raises_installation_error_when_anthropic_sdk_missing(
     assert "ai[anthropic]" in str(exc_info.value)
 
 
+def test_import_ai_does_not_load_anthropic_sdk() -> None:
+    code = "import sys, ai; print('anthropic' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
 def test_get_provider_accepts_base_url_and_api_key() -> None:
     provider = ai.get_provider(
         "anthropic",
@@ -22,6 +22,7 @@ from ai.types import events, messages
 from .conftest import (
     FakeAnthropicClient,
     FakeStream,
+    FakeUsage,
     block_delta,
     block_start,
     block_stop,
@@ -183,3 +184,41 @@ async def test_builtin_tool_end_carries_call_part(
     assert isinstance(end_event.tool_call, messages.BuiltinToolCallPart)
     assert end_event.tool_call.tool_call_id == "srvtoolu_42"
     assert end_event.tool_call.tool_args == '{"q":"x"}'
+
+
+async def test_cache_token_usage_is_reported(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stream = FakeStream()
+    stream.current_message_snapshot.usage = FakeUsage(
+        input_tokens=10,
+        output_tokens=5,
+        cache_read_input_tokens=7,
+        cache_creation_input_tokens=3,
+    )
+    s = await _drain(stream, monkeypatch)
+
+    assert s.usage is not None
+    assert s.usage.cache_read_tokens == 7
+    assert s.usage.cache_write_tokens == 3
+
+
+async def test_signature_deltas_are_concatenated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sdk_events = [
+        block_start(0, "thinking"),
+        block_delta(0, "thinking_delta", thinking="hidden"),
+        block_delta(0, "signature_delta", signature="si"),
+        block_delta(0, "signature_delta", signature="g-"),
+        block_delta(0, "signature_delta", signature="123"),
+        block_stop(0),
+    ]
+    s = await _drain(FakeStream(sdk_events), monkeypatch)
+
+    reasoning = s.message.parts[0]
+    assert isinstance(reasoning, messages.ReasoningPart)
+    assert reasoning.provider_metadata == {
+        "provider": "anthropic",
+        "signature": "sig-123",
+    }
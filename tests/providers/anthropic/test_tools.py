@@ -190,3 +190,30 @@ def test_web_fetch_rejects_mutually_exclusive_domains() -> None:
             allowed_domains=["a.example"],
             blocked_domains=["b.example"],
         )
+
+
+def _function_tool(name: str, description: str) -> ai.tools.Tool:
+    return ai.tools.Tool(
+        kind="function",
+        name=name,
+        args=ai.tools.FunctionToolArgs(
+            description=description,
+            params={"type": "object", "properties": {}},
+        ),
+    )
+
+
+def test_function_tool_schema_not_shared_across_requests() -> None:
+    tool = _function_tool("lookup", "Look something up.")
+
+    first = protocol._custom_tools_to_anthropic([tool])
+    first[0]["cache_control"] = {"type": "ephemeral"}
+    second = protocol._custom_tools_to_anthropic([tool])
+
+    assert second == [
+        {
+            "name": "lookup",
+            "description": "Look something up.",
+            "input_schema": {"type": "object", "properties": {}},
+        }
+    ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextvars
+import json
 from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any, cast
 
@@ -654,3 +655,16 @@ def test_merge_cleanup_on_asyncio_shutdown() -> None:
     asyncio.run(main())
 
     assert cleanup_log == ["ok"], cleanup_log
+
+
+@pytest.mark.parametrize(
+    "data",
+    ['{"a": [1, 2.5, null]}', '"\\ud800"', "[" * 300 + "]" * 300],
+)
+def test_parse_json_accepts_what_json_loads_accepts(data: str) -> None:
+    assert util.parse_json(data) == json.loads(data)
+
+
+def test_parse_json_invalid_raises_json_decode_error() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        util.parse_json("{broken")
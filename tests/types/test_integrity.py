@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator, Sequence
-from typing import Any, Literal
+from typing import Any, Literal, cast
 from unittest.mock import patch
 
 import pydantic
@@ -189,6 +189,19 @@ def test_fixes_invalid_tool_args() -> None:
     assert tc.tool_args == "{}"
 
 
+def test_fixes_non_str_tool_args() -> None:
+    msg = _assistant_with_tool_call()
+    tc = msg.parts[0]
+    assert isinstance(tc, messages.ToolCallPart)
+    # Bypasses validation, as a caller mutating a part in place would.
+    tc.tool_args = cast("Any", {"a": 1})
+
+    result = prepare_messages([msg])
+    fixed = result[0].parts[0]
+    assert isinstance(fixed, messages.ToolCallPart)
+    assert fixed.tool_args == "{}"
+
+
 def test_preserves_valid_tool_args() -> None:
     msg = _assistant_with_tool_call(tool_args='{"key": "value"}')
     result = prepare_messages([msg])
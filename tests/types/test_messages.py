@@ -112,3 +112,14 @@ def test_from_bytes_explicit_overrides() -> None:
 def test_from_bytes_unknown_raises() -> None:
     with pytest.raises(ValueError, match="Cannot detect media_type"):
         messages.FilePart.from_bytes(b"\x00\x01\x02\x03")
+
+
+def test_generate_id_shape() -> None:
+    raw = messages.generate_id()
+    assert len(raw) == 12
+    int(raw, 16)
+
+    prefixed = messages.generate_id("msg")
+    assert prefixed.startswith("msg_")
+    assert len(prefixed) == len("msg_") + 12
+    assert messages.generate_id() != raw